@@ -0,0 +1,166 @@
+"""Candidate domain enumeration, kept free of DomainGenerator state.
+
+This module is fully type annotated so it can be compiled with mypyc for
+large word lists:
+
+    mypyc domain_combinations.py
+
+The compiled extension is picked up automatically in place of this file;
+without it the pure-Python version below is used unchanged.
+"""
+
+import random
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+NUMBER_TOKENS = ('1', '2', '3', '24', '7', '360', '100', '200', '500', '1000')
+
+
+def iter_combinations(
+    word_list: Sequence[str],
+    endings: Sequence[str],
+    connectors: Sequence[str],
+    compulsory_word: Optional[str],
+    num_words: int,
+    include_numbers: bool = False,
+    limit: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    suffix_cache: Optional[Dict[str, Tuple[str, ...]]] = None,
+    extra: Sequence[str] = ()
+) -> Iterator[str]:
+    """Lazily yield extra followed by candidate domains built from word_list. The stream may contain repeats.
+    
+    Repeated words in word_list are ignored, so a word is never combined with itself.
+    If limit is given and there are more candidates than that, limit of them are
+    drawn uniformly at random from all stages together (extra, compulsory-word,
+    pair, three-word, suffix and number names), so each stage keeps its share of
+    the output instead of being enumerated in full.
+    rng defaults to a fresh random.Random(). suffix_cache, if given, maps words
+    to their word + ending strings and is filled in as words are used; the
+    caller must clear it whenever endings changes. It is only read and filled
+    when the candidates are enumerated in full: a sampled run picks single
+    suffixes, so building whole tuples there would cost more than it saves.
+    """
+    # Keep the first occurrence of each word; a no-op for DomainGenerator's already distinct list
+    word_list = tuple(dict.fromkeys(word_list))
+    if rng is None:
+        rng = random.Random()
+    n = len(word_list)
+    
+    # Make every random word choice first, so the size of each stage is known up front
+    anchor = (compulsory_word or '') if word_list else ''  # No words: nothing to anchor to
+    if anchor:
+        # If compulsory word is set, ensure it's in all combinations
+        partners = tuple([word for word in word_list if word != anchor])
+        anchor_endings: Sequence[str] = endings
+        pair_count = 0
+        triple_words: List[str] = []
+    else:
+        partners = ()
+        anchor_endings = ()
+        pair_count = n * (n - 1) // 2 if num_words >= 2 and n >= 2 else 0
+        triple_words = rng.sample(word_list, min(20, n)) if num_words >= 3 and n >= 2 else []
+    suffix_words = rng.sample(word_list, min(10, n))
+    number_words = rng.sample(word_list, min(15, n)) if include_numbers else []
+    
+    m = len(triple_words)
+    stage_sizes = (
+        len(extra),
+        2 * len(partners) + len(anchor_endings),
+        pair_count,
+        len(connectors) * m * (m - 1),
+        len(suffix_words) * len(endings),
+        len(number_words) * 2 * len(NUMBER_TOKENS)
+    )
+    total = sum(stage_sizes)
+    
+    if limit is None or total <= limit:
+        yield from extra
+        
+        # Combinations with compulsory word, then with endings
+        for word in partners:
+            yield anchor + word
+            yield word + anchor
+        for ending in anchor_endings:
+            yield anchor + ending
+        
+        # Two-word combinations
+        if pair_count:
+            # Row-wise slices instead of itertools.combinations: no (i, j) tuple per pair
+            for i, word1 in enumerate(word_list):
+                for word2 in word_list[i + 1:]:
+                    yield word1 + word2
+        
+        # Three-word combinations with connectors
+        # Skip i == j by slicing around it rather than comparing every triple;
+        # the sampled words are distinct because word_list is
+        for connector in connectors:
+            for i, word1 in enumerate(triple_words):
+                head = word1 + connector
+                for word2 in triple_words[:i]:
+                    yield head + word2
+                for word2 in triple_words[i + 1:]:
+                    yield head + word2
+        
+        # Add suffixes
+        for word in suffix_words:
+            if suffix_cache is None:
+                for suffix in endings:
+                    yield word + suffix
+            else:
+                suffixed = suffix_cache.get(word)
+                if suffixed is None:
+                    suffixed = suffix_cache[word] = tuple([word + suffix for suffix in endings])
+                yield from suffixed
+        
+        # Add numbers if requested
+        for word in number_words:
+            for num in NUMBER_TOKENS:
+                yield word + num
+                yield num + word
+        return
+    
+    # Walk sorted positions in the concatenated stages, in the order above. Within the
+    # pair stage usually only the right-hand word moves, and the row advances just when
+    # a position passes its end, so no position is ever inverted from scratch.
+    stage = 0
+    stage_start = 0
+    stage_end = stage_sizes[0]
+    row = row_start = 0
+    row_end = n - 1
+    anchored = 2 * len(partners)
+    per_connector = m * (m - 1)
+    per_number_word = 2 * len(NUMBER_TOKENS)
+    for index in sorted(rng.sample(range(total), limit)):
+        while index >= stage_end:
+            stage += 1
+            stage_start = stage_end
+            stage_end += stage_sizes[stage]
+        offset = index - stage_start
+        if stage == 0:
+            yield extra[offset]
+        elif stage == 1:
+            if offset < anchored:
+                word = partners[offset >> 1]
+                yield word + anchor if offset & 1 else anchor + word
+            else:
+                yield anchor + anchor_endings[offset - anchored]
+        elif stage == 2:
+            while offset >= row_end:
+                row += 1
+                row_start = row_end
+                row_end += n - 1 - row
+            yield word_list[row] + word_list[offset - row_start + row + 1]
+        elif stage == 3:
+            connector_index, rest = divmod(offset, per_connector)
+            i, j = divmod(rest, m - 1)
+            if j >= i:
+                j += 1  # Skip the diagonal, as the slices above do
+            yield triple_words[i] + connectors[connector_index] + triple_words[j]
+        elif stage == 4:
+            i, e = divmod(offset, len(endings))
+            yield suffix_words[i] + endings[e]
+        else:
+            i, r = divmod(offset, per_number_word)
+            word = number_words[i]
+            num = NUMBER_TOKENS[r >> 1]
+            yield num + word if r & 1 else word + num
@@ -1,34 +1,253 @@
 #!/usr/bin/env python3
 
+import argparse
+import array
+import asyncio
+import contextlib
+import hashlib
+import mmap
 import random
 import socket
+import sqlite3
 import itertools
+import math
 import time
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import subprocess
 import re
-import json
 import os
-from typing import List, Set, Optional, Union
-import requests
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Set, Optional, Sequence, Tuple, Union
 
-# Try to import python-dotenv for .env file support
+if TYPE_CHECKING:
+    import requests  # Imported on first use; it is only needed for AI generation
+
+from domain_combinations import iter_combinations
+
+def load_env_file():
+    """Load variables from a .env file if python-dotenv is installed."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+# dnspython is optional; with it DNS queries go straight to public resolvers
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.resolver
+except ImportError:
+    dns = None
+
+# aiodns is optional; without it (or dnspython) DNS lookups run on a thread pool
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+# aiohttp is optional; without it registrations are verified with the whois command
 try:
-    from dotenv import load_dotenv
-    load_dotenv()  # Load .env file if it exists
+    import aiohttp
 except ImportError:
-    pass
+    aiohttp = None
+
+RDAP_URL = "https://rdap.verisign.com/com/v1/domain/{}"
+
+# Registry WHOIS server for .com, queried directly instead of through the whois command
+WHOIS_SERVER = ('whois.verisign-grs.com', 43)
+WHOIS_TIMEOUT = 10  # Seconds per WHOIS query
+
+# WHOIS responses that mean "slow down" rather than "not registered"
+RATE_LIMIT_PATTERNS = (
+    'connection limit exceeded',
+    'rate limit',
+    'exceeded the maximum',
+    'try again later',
+    'quota exceeded'
+)
+
+# Upper bound on a single DNS lookup, in seconds
+DNS_TIMEOUT = 3.0
+
+# Recursive resolvers queried directly by dnspython, bypassing the system resolver stack
+PUBLIC_RESOLVERS = ('1.1.1.1', '8.8.8.8')
+PUBLIC_DNS_LIFETIME = 2.0  # Seconds per query, across all resolvers and retries
+
+# On-disk availability cache shared across runs
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.domain_generator', 'cache.db')
+DISK_CACHE_TTL = 24 * 3600
+
+# Bloom filter of domains known to be registered, sized for about 1% false positives at capacity
+DEFAULT_BLOOM_PATH = os.path.join(os.path.expanduser('~'), '.domain_generator', 'taken.bloom')
+BLOOM_CAPACITY = 1_000_000
+BLOOM_HASHES = 7
+BLOOM_BITS = math.ceil(-BLOOM_CAPACITY * math.log(0.01) / math.log(2) ** 2)  # ~1.2 MB on disk
+
+# Seconds between progress redraws during batch checks
+PROGRESS_INTERVAL = 0.1
+
+# WHOIS responses that mean the domain is not registered
+NOT_FOUND_PATTERNS = (
+    'no match',
+    'not found',
+    'no entries found',
+    'no data found',
+    'domain not found',
+    'no matching record',
+    'available for registration'
+)
+
+# WHOIS fields that only appear for registered domains
+REGISTERED_PATTERNS = (
+    'creation date',
+    'created',
+    'registrar',
+    'expiration date',
+    'expires',
+    'name server',
+    'nameserver'
+)
+
+# Word tables shared by every generator, built once at import
+STARTUP_ENDINGS = tuple(dict.fromkeys(['fy', 'ly', 'io', 'ai', 'app', 'hub', 'lab', 'co', 'go', 'do', 'up', 'kit', 'box', 'zen', 'wave', 'flow', 'spark', 'boost', 'shift', 'leap', 'rush', 'dash', 'zoom', 'sync', 'flex', 'edge', 'mint', 'glow', 'vibe', 'nova', 'pulse', 'peak', 'beam', 'bolt', 'wrap', 'flip', 'snap', 'drop', 'link', 'ping', 'buzz', 'loop', 'grid', 'lens', 'core', 'base', 'stack', 'trace', 'chain', 'nest', 'pod', 'dock', 'spot', 'node', 'cast', 'stream', 'cloud', 'deck', 'forge', 'space', 'ship', 'verse', 'scope', 'view', 'sense', 'mind', 'gear', 'tool', 'path', 'road', 'bridge', 'port', 'gate', 'door', 'star', 'moon', 'sun', 'sky', 'earth', 'sea', 'wind', 'fire', 'ice', 'stone', 'wood', 'steel', 'gold', 'silver', 'blue', 'red', 'green', 'black', 'white']))
+CONNECTORS = ('', 'and', 'for', 'the', 'of', 'in', 'on', 'at', 'by', 'with')
+SUFFIXES = ('ly', 'hub', 'lab', 'pro', 'max', 'ai', 'io', 'app', 'sys', 'net')
+
+# Verification method labels; BatchResults stores an index into this tuple
+VERIFICATION_METHODS = (
+    'DNS only',
+    'DNS + WHOIS',
+    'DNS + WHOIS (timeout)',
+    'DNS + RDAP',
+    'DNS + RDAP (timeout)',
+    'Known taken'
+)
+
+class _RateLimited(Exception):
+    """Raised when a WHOIS server refuses a query because of rate limiting."""
+
+@dataclass(slots=True)
+class BatchResults:
+    """Availability results for a batch, stored as parallel arrays indexed by position.
+    
+    dns_available uses 1 (might be available), 0 (taken) and -1 (unclear).
+    URLs and full domain names are formatted on demand rather than stored.
+    """
+    domains: List[str]
+    dns_available: array.array
+    whois_available: List[Optional[bool]]
+    available: array.array
+    verification_method: array.array
+    
+    @classmethod
+    def for_domains(cls, domains: List[str]) -> 'BatchResults':
+        n = len(domains)
+        return cls(
+            domains=list(domains),
+            dns_available=array.array('b', [-1]) * n,
+            whois_available=[None] * n,
+            available=array.array('b', [0]) * n,
+            verification_method=array.array('B', [0]) * n
+        )
+    
+    def __len__(self) -> int:
+        return len(self.domains)
+    
+    def full_domain(self, i: int) -> str:
+        return self.domains[i] + ".com"
+    
+    def godaddy_url(self, i: int) -> str:
+        return f"https://www.godaddy.com/domainsearch/find?domainToCheck={self.domains[i]}.com"
+    
+    def method(self, i: int) -> str:
+        return VERIFICATION_METHODS[self.verification_method[i]]
+    
+    def is_verified(self, i: int) -> bool:
+        """True if a registry lookup (WHOIS or RDAP) confirmed the DNS result."""
+        return self.method(i) in ('DNS + WHOIS', 'DNS + RDAP')
+
+class TakenFilter:
+    """On-disk Bloom filter of registered domains, memory-mapped so lookups never read the whole file.
+    
+    Membership can be a false positive (about 1% at BLOOM_CAPACITY entries), never a false negative.
+    reset=True empties an existing filter.
+    """
+    
+    def __init__(self, path: str, num_bits: int = BLOOM_BITS, num_hashes: int = BLOOM_HASHES, reset: bool = False):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        size = (num_bits + 7) // 8
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if reset or os.fstat(fd).st_size != size:
+                # Missing, built with other parameters or being rebuilt: start over with an empty filter
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+            self._bits = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)  # The mapping keeps its own reference to the file
+    
+    def _positions(self, domain: str) -> Iterator[int]:
+        # Double hashing: k probe positions from the two halves of a single digest
+        digest = hashlib.blake2b(domain.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for k in range(self.num_hashes):
+            yield (h1 + k * h2) % self.num_bits
+    
+    def __contains__(self, domain: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(domain))
+    
+    def add(self, domain: str):
+        bits = self._bits
+        for pos in self._positions(domain):
+            bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def flush(self):
+        self._bits.flush()
 
 class DomainGenerator:
-    def __init__(self):
+    # One case-insensitive pass over the WHOIS text per pattern group, compiled once at import
+    _WHOIS_RATE_LIMITED = re.compile('|'.join(map(re.escape, RATE_LIMIT_PATTERNS)), re.IGNORECASE)
+    _WHOIS_AVAIL = re.compile('|'.join(map(re.escape, NOT_FOUND_PATTERNS)), re.IGNORECASE)
+    _WHOIS_TAKEN = re.compile('|'.join(map(re.escape, REGISTERED_PATTERNS)), re.IGNORECASE)
+    
+    def __init__(
+        self,
+        dns_concurrency: int = 64,
+        whois_concurrency: int = 8,
+        cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+        rebuild_cache: bool = False,
+        bloom_path: Optional[str] = DEFAULT_BLOOM_PATH
+    ):
+        self.dns_concurrency = dns_concurrency
+        self.whois_concurrency = whois_concurrency
+        self.cache_path = cache_path  # None disables the on-disk result cache
+        self.rebuild_cache = rebuild_cache  # Re-check everything, but still save fresh results
+        self._cache_db = None
+        self.bloom_path = bloom_path  # None disables the known-taken filter
+        self._taken = None
+        self._http = None
+        self.whois_max_tries = 3
+        self.whois_backoff = 1.0  # Base delay in seconds, doubled on every retry
+        self.whois_min_interval = 0.1  # Minimum spacing between queries to the same TLD
+        self._tld_next_allowed = {}
+        # AI response parsing: strip everything but lowercase letters and digits
+        self._clean_re = re.compile(r'[^a-z0-9]')
+        self._skip_prefixes = ('#', 'Example')
         self.custom_words = []
         self.partial_words = []
         self.compulsory_word = None
+        self._wordlist_cache = None  # (key, word list) for the most recent inputs
+        self._rng = random.Random()  # Own generator state rather than the shared module-level one
         self.use_startup_endings = False
-        self.startup_endings = ['fy', 'ly', 'io', 'ai', 'app', 'hub', 'lab', 'co', 'go', 'do', 'up', 'kit', 'box', 'zen', 'wave', 'flow', 'spark', 'boost', 'shift', 'leap', 'rush', 'dash', 'zoom', 'sync', 'flex', 'edge', 'mint', 'glow', 'vibe', 'nova', 'pulse', 'peak', 'beam', 'bolt', 'wrap', 'flip', 'snap', 'drop', 'link', 'ping', 'buzz', 'loop', 'grid', 'lens', 'core', 'base', 'stack', 'trace', 'chain', 'nest', 'pod', 'dock', 'spot', 'node', 'cast', 'stream', 'cloud', 'deck', 'forge', 'space', 'ship', 'verse', 'scope', 'view', 'sense', 'mind', 'gear', 'tool', 'path', 'road', 'bridge', 'port', 'gate', 'door', 'star', 'moon', 'sun', 'sky', 'earth', 'sea', 'wind', 'fire', 'ice', 'stone', 'wood', 'steel', 'gold', 'silver', 'blue', 'red', 'green', 'black', 'white']
-        
-        self.connectors = ['', 'and', 'for', 'the', 'of', 'in', 'on', 'at', 'by', 'with']
-        self.suffixes = ['ly', 'hub', 'lab', 'pro', 'max', 'ai', 'io', 'app', 'sys', 'net']
+        self._word_suffix = {}  # word -> word + ending strings for the current words and endings
+        self.startup_endings = STARTUP_ENDINGS
+        self.connectors = CONNECTORS
+        self.suffixes = SUFFIXES
         
     def set_custom_words(self, words_input: str):
         self.custom_words = [word.strip().lower() for word in words_input.split(',') if word.strip()]
@@ -40,199 +259,539 @@ class DomainGenerator:
         self.compulsory_word = word.strip().lower() if word.strip() else None
     
     def set_startup_endings(self, use_endings: bool):
+        if use_endings != self.use_startup_endings:
+            self._word_suffix.clear()  # Built for the other set of endings
         self.use_startup_endings = use_endings
     
-    def get_word_list(self) -> List[str]:
-        all_words = []
-        
-        # Add custom words
-        if self.custom_words:
-            all_words.extend(self.custom_words)
+    def get_word_list(self) -> Tuple[str, ...]:
+        """Custom and partial words, deduplicated in input order. Cached until the inputs change."""
+        key = (tuple(self.custom_words), tuple(self.partial_words))
+        if self._wordlist_cache is not None and self._wordlist_cache[0] == key:
+            return self._wordlist_cache[1]
         
-        # Add partial words
-        if self.partial_words:
-            all_words.extend(self.partial_words)
-        
-        return list(set(all_words))
+        word_list = tuple(dict.fromkeys(itertools.chain.from_iterable(key)))
+        self._wordlist_cache = (key, word_list)
+        self._word_suffix.clear()  # Keep the suffix memo to the current words only
+        return word_list
     
-    def get_endings(self) -> List[str]:
+    def get_endings(self) -> Tuple[str, ...]:
         if self.use_startup_endings:
             return self.startup_endings
         return self.suffixes
     
-    def generate_combinations(self, num_words: int, include_numbers: bool = False) -> List[str]:
-        word_list = self.get_word_list()
+    def generate_combinations(
+        self,
+        num_words: int,
+        include_numbers: bool = False,
+        limit: Optional[int] = None,
+        extra: Sequence[str] = ()
+    ) -> Iterator[str]:
+        """Lazily yield extra followed by candidate domains. The stream may contain repeats.
         
-        if not word_list:
-            return []
-            
-        domains = set()
-        
-        # If compulsory word is set, ensure it's in all combinations
-        if self.compulsory_word:
-            # Combinations with compulsory word
-            for word in word_list:
-                if word != self.compulsory_word:
-                    domains.add(f"{self.compulsory_word}{word}")
-                    domains.add(f"{word}{self.compulsory_word}")
-            
-            # Add with endings
-            for ending in self.get_endings():
-                domains.add(f"{self.compulsory_word}{ending}")
-        else:
-            # Two-word combinations
-            if num_words >= 2 and len(word_list) >= 2:
-                for word1, word2 in itertools.combinations(word_list, 2):
-                    domains.add(f"{word1}{word2}")
-                    
-            # Three-word combinations with connectors
-            if num_words >= 3 and len(word_list) >= 2:
-                sample_words = random.sample(word_list, min(20, len(word_list)))
-                for word1, connector, word2 in itertools.product(
-                    sample_words, self.connectors[:3], sample_words
-                ):
-                    if word1 != word2:
-                        if connector:
-                            domains.add(f"{word1}{connector}{word2}")
-                        else:
-                            domains.add(f"{word1}{word2}")
-        
-        # Add suffixes
-        base_words = random.sample(word_list, min(10, len(word_list)))
-        for word in base_words:
-            for suffix in self.get_endings():
-                domains.add(f"{word}{suffix}")
-        
-        # Add numbers if requested
-        if include_numbers:
-            for word in random.sample(word_list, min(15, len(word_list))):
-                for num in [1, 2, 3, 24, 7, 360, 100, 200, 500, 1000]:
-                    domains.add(f"{word}{num}")
-                    domains.add(f"{num}{word}")
-        
-        return list(domains)
-    
-    def check_domain_availability(self, domain: str) -> bool:
+        limit caps how many candidates are yielded; larger populations are sampled at the
+        same rate from every stage, extra included.
+        Suffixed names are memoized per generator for the current word list and endings,
+        which only helps repeat calls on this instance that enumerate in full (no limit,
+        or a population under it).
+        """
+        return iter_combinations(
+            self.get_word_list(), self.get_endings(), tuple(self.connectors[:3]),  # Short connectors only
+            self.compulsory_word, num_words, include_numbers, limit, self._rng,
+            self._word_suffix, extra
+        )
+    
+    def sample_combinations(self, k: int, num_words: int, include_numbers: bool = False, extra: Sequence[str] = ()) -> List[str]:
+        """Up to k distinct candidates sampled from extra together with the generated names.
+        
+        extra (e.g. AI suggestions) counts as one more stage of the population and is
+        subsampled at the same rate as the pair, three-word, suffix and number names,
+        so an extra name is no more likely to be picked than a generated one; with a
+        large word list few or none of them make it into the sample. Names that occur
+        more than once (in extra and the generated stages, or in several stages) are
+        proportionally more likely to be picked.
+        Candidates go straight into a k-slot reservoir, so memory stays O(k).
+        """
+        # Oversample a little so repeated names don't leave the sample short
+        stream = self.generate_combinations(num_words, include_numbers, limit=k * 4, extra=extra)
+        return reservoir_sample(stream, k, self._rng)
+    
+    def check_domain_availability(self, domain: str) -> Optional[bool]:
+        """Check domain availability using DNS. Returns True if it might be available, False if taken, None if unclear."""
         try:
-            socket.gethostbyname(f"{domain}.com")
+            socket.getaddrinfo(domain + ".com", None, socket.AF_INET, socket.SOCK_STREAM)
             return False  # Domain exists
-        except socket.gaierror:
+        except socket.gaierror as e:
+            if e.errno == socket.EAI_AGAIN:
+                return None  # Temporary resolver failure - unclear status
             return True   # Domain might be available
+        except socket.timeout:
+            return None  # Timeout - unclear status
     
-    def whois_check(self, domain: str) -> Optional[bool]:
-        """Check domain availability using WHOIS. Returns True if available, False if taken, None if unclear."""
+    def _parse_whois(self, whois_output: str) -> bool:
+        """Classify WHOIS output. Returns True if available, False if taken.
+        
+        Raises _RateLimited if the server refused to answer.
+        """
+        rate_limited = self._WHOIS_RATE_LIMITED.search(whois_output)
+        if rate_limited:
+            raise _RateLimited(rate_limited.group(0))
+        
+        if self._WHOIS_AVAIL.search(whois_output):
+            return True  # Domain appears to be available
+        
+        if self._WHOIS_TAKEN.search(whois_output):
+            return False  # Domain is registered
+        
+        return True  # Default to available if unclear
+    
+    def _whois_query(self, domain: str) -> Optional[bool]:
+        """Run a single blocking whois subprocess and classify its output.
+        
+        Raises _RateLimited like _parse_whois, so callers can decide whether to retry.
+        """
         try:
             result = subprocess.run(
                 ['whois', f"{domain}.com"],
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=WHOIS_TIMEOUT
             )
-            
-            if result.returncode != 0:
-                return True  # Likely available if whois fails
-            
-            whois_output = result.stdout.lower()
-            
-            # Check for common "not found" or "available" indicators
-            not_found_patterns = [
-                'no match',
-                'not found',
-                'no entries found',
-                'no data found',
-                'domain not found',
-                'no matching record',
-                'available for registration'
-            ]
-            
-            for pattern in not_found_patterns:
-                if pattern in whois_output:
-                    return True  # Domain appears to be available
-            
-            # Check for registration indicators
-            registered_patterns = [
-                'creation date',
-                'created',
-                'registrar',
-                'expiration date',
-                'expires',
-                'name server',
-                'nameserver'
-            ]
-            
-            for pattern in registered_patterns:
-                if pattern in whois_output:
-                    return False  # Domain is registered
-            
-            return True  # Default to available if unclear
-            
         except subprocess.TimeoutExpired:
             return None  # Timeout - unclear status
         except Exception:
             return None  # Error - unclear status
+        
+        if result.returncode != 0:
+            return True  # Likely available if whois fails
+        
+        return self._parse_whois(result.stdout)
+    
+    @staticmethod
+    def _whois_request(domain: str) -> bytes:
+        """WHOIS query line for domain.com. Raises UnicodeError if the name is not a valid IDNA label."""
+        # The "domain" keyword limits matches to domain records, as the whois command does
+        return b'domain ' + (domain + '.com').encode('idna') + b'\r\n'
     
-    def batch_check_domains(self, domains: List[str], show_progress: bool = True) -> List[dict]:
-        results = []
-        total = len(domains)
+    def _whois_tcp(self, domain: str) -> Optional[bool]:
+        """Query the .com registry WHOIS server over a plain socket and classify the reply.
         
-        # Stage 1: DNS checking
-        dns_available = []
-        for i, domain in enumerate(domains):
-            if show_progress:
-                print(f"\rDNS check... {i+1}/{total} ({(i+1)/total*100:.1f}%)", end='', flush=True)
-            
-            is_dns_available = self.check_domain_availability(domain)
-            godaddy_url = f"https://www.godaddy.com/domainsearch/find?domainToCheck={domain}.com"
-            
-            result = {
-                'domain': domain,
-                'dns_available': is_dns_available,
-                'whois_available': None,
-                'available': is_dns_available,
-                'full_domain': f"{domain}.com",
-                'godaddy_url': godaddy_url,
-                'verification_method': 'DNS only'
-            }
-            
-            results.append(result)
-            
-            if is_dns_available:
-                dns_available.append(result)
-            
-            time.sleep(0.1)
+        Raises OSError if the server can't be reached, and _RateLimited like _parse_whois.
+        """
+        try:
+            request = self._whois_request(domain)
+        except UnicodeError:
+            return None  # Not a valid domain name - unclear status
+        try:
+            with socket.create_connection(WHOIS_SERVER, timeout=WHOIS_TIMEOUT) as sock:
+                sock.sendall(request)
+                chunks = []
+                while chunk := sock.recv(4096):
+                    chunks.append(chunk)
+        except TimeoutError:
+            return None  # Timeout - unclear status
+        return self._parse_whois(b''.join(chunks).decode('latin-1'))
+    
+    def whois_check(self, domain: str) -> Optional[bool]:
+        """Check domain availability using WHOIS. Returns True if available, False if taken, None if unclear."""
+        try:
+            try:
+                return self._whois_tcp(domain)
+            except OSError:
+                return self._whois_query(domain)  # Port 43 blocked or unreachable: try the whois command
+        except _RateLimited:
+            return None  # Rate limited - unclear status
+    
+    async def _wait_for_tld_slot(self, tld: str):
+        """Reserve the next query slot for a TLD and sleep until it comes up."""
+        now = time.monotonic()
+        slot = max(now, self._tld_next_allowed.get(tld, 0.0))
+        self._tld_next_allowed[tld] = slot + self.whois_min_interval
+        await asyncio.sleep(slot - now)
+    
+    def _back_off_tld(self, tld: str, attempt: int):
+        """Push back every pending query for a TLD after its server rate limited us."""
+        resume_at = time.monotonic() + 2 ** attempt * self.whois_backoff
+        self._tld_next_allowed[tld] = max(self._tld_next_allowed.get(tld, 0.0), resume_at)
+    
+    async def _whois_query_async(self, domain: str) -> Optional[bool]:
+        """Run a single whois subprocess and classify its output."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'whois', f"{domain}.com",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except NotImplementedError:
+            # Event loop without subprocess support (e.g. SelectorEventLoop on Windows):
+            # run the blocking query on the loop's thread pool instead
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._whois_query, domain)
+        except Exception:
+            return None  # whois not installed or not runnable
         
-        if show_progress:
-            print("\n")
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(), timeout=WHOIS_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None  # Timeout - unclear status
         
-        # Stage 2: WHOIS verification for DNS-available domains
-        if dns_available:
-            if show_progress:
-                print(f"\nVerifying {len(dns_available)} potentially available domains with WHOIS...")
+        if proc.returncode != 0:
+            return True  # Likely available if whois fails
+        
+        return self._parse_whois(out.decode('utf-8', 'ignore'))
+    
+    async def _whois_tcp_async(self, domain: str) -> Optional[bool]:
+        """Async variant of _whois_tcp, falling back to the whois command if the server can't be reached."""
+        try:
+            request = self._whois_request(domain)
+        except UnicodeError:
+            return None  # Not a valid domain name - unclear status
+        
+        async def query() -> bytes:
+            reader, writer = await asyncio.open_connection(*WHOIS_SERVER)
+            try:
+                writer.write(request)
+                await writer.drain()
+                return await reader.read()  # The server closes the connection after replying
+            finally:
+                writer.close()
+        
+        try:
+            reply = await asyncio.wait_for(query(), timeout=WHOIS_TIMEOUT)
+        except asyncio.TimeoutError:
+            return None  # Timeout - unclear status
+        except OSError:
+            return await self._whois_query_async(domain)
+        return self._parse_whois(reply.decode('latin-1'))
+    
+    async def rdap_check(self, session, domain: str) -> Optional[bool]:
+        """Check domain availability using the Verisign RDAP service. Returns True if available, False if taken, None if unclear.
+        
+        Raises _RateLimited on HTTP 429.
+        """
+        try:
+            async with session.get(RDAP_URL.format(domain + ".com")) as response:
+                if response.status == 404:
+                    return True  # No registration record
+                if response.status == 200:
+                    return False  # Domain is registered
+                if response.status == 429:
+                    raise _RateLimited('HTTP 429')
+                return None  # Unexpected status - unclear
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None  # Network error or timeout - unclear status
+    
+    async def _whois_async(self, sem: asyncio.Semaphore, domain: str, session=None) -> Optional[bool]:
+        """Async variant of whois_check, with per-TLD pacing and exponential backoff on rate limits.
+        
+        Uses RDAP over the given aiohttp session when there is one.
+        The semaphore caps concurrent queries to the registry servers.
+        """
+        tld = 'com'  # All generated domains are checked as .com
+        async with sem:
+            for attempt in range(self.whois_max_tries):
+                await self._wait_for_tld_slot(tld)
+                try:
+                    if session is not None:
+                        return await self.rdap_check(session, domain)
+                    return await self._whois_tcp_async(domain)
+                except _RateLimited:
+                    self._back_off_tld(tld, attempt)
+            return None  # Still rate limited after all retries - unclear status
+    
+    async def _dns_check_async(self, resolver, sem: asyncio.Semaphore, domain: str) -> Optional[bool]:
+        """Resolve a single domain without blocking the event loop. Returns True if it might be available."""
+        async with sem:
+            if resolver is None:
+                # getaddrinfo has no timeout of its own, so bound how long we wait on the thread
+                loop = asyncio.get_running_loop()
+                try:
+                    return await asyncio.wait_for(
+                        loop.run_in_executor(None, self.check_domain_availability, domain),
+                        timeout=DNS_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    return None  # Timeout - unclear status
+            if dns is not None:
+                try:
+                    await resolver.resolve(domain + ".com", 'A', search=False)
+                    return False  # Domain exists
+                except dns.resolver.NXDOMAIN:
+                    return True   # Domain might be available
+                except dns.exception.DNSException:
+                    return None  # No A record, timeout or server failure - unclear status
+            try:
+                await resolver.getaddrinfo(domain + ".com", socket.AF_INET)
+                return False  # Domain exists
+            except aiodns.error.DNSError as e:
+                if e.args and e.args[0] in (aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA):
+                    return True   # Domain might be available
+                return None  # Timeout or server failure - unclear status
+    
+    def _rdap_session(self):
+        """Shared HTTPS session for RDAP lookups, or a no-op context when aiohttp is missing."""
+        if aiohttp is None:
+            return contextlib.nullcontext()
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=600),
+            timeout=aiohttp.ClientTimeout(total=10),
+            headers={"Accept": "application/rdap+json"}
+        )
+    
+    async def _batch_check_async(self, results: BatchResults, indices: List[int], show_progress: bool = True, on_result=None):
+        """Check the domains at the given indices, feeding each DNS hit straight into WHOIS verification.
+        
+        DNS lookups run concurrently (bounded by dns_concurrency) and push every
+        possibly available domain onto a queue drained by whois_concurrency workers,
+        so the WHOIS stage starts as soon as the first DNS answer arrives.
+        on_result(results, i) is called as soon as domain i's status is final.
+        """
+        if dns is not None:
+            resolver = dns.asyncresolver.Resolver(configure=False)
+            resolver.nameservers = list(PUBLIC_RESOLVERS)
+            resolver.lifetime = PUBLIC_DNS_LIFETIME
+        elif aiodns:
+            resolver = aiodns.DNSResolver(timeout=DNS_TIMEOUT, tries=1)
+        else:
+            # Blocking lookups run on threads; size the pool so it doesn't cap dns_concurrency
+            resolver = None
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=self.dns_concurrency, thread_name_prefix='dns')
+            )
+        dns_sem = asyncio.Semaphore(self.dns_concurrency)
+        whois_sem = asyncio.Semaphore(self.whois_concurrency)
+        verified = VERIFICATION_METHODS.index('DNS + RDAP' if aiohttp else 'DNS + WHOIS')
+        unclear = verified + 1  # The matching "(timeout)" label
+        queue = asyncio.Queue()
+        total = len(indices)
+        dns_done = whois_queued = whois_done = 0
+        
+        def report():
+            print(f"\rDNS check... {dns_done}/{total} ({dns_done/total*100:.1f}%) | "
+                  f"WHOIS check... {whois_done}/{whois_queued}", end='', flush=True)
+        
+        async def report_progress():
+            # Redraw at a fixed rate instead of once per lookup
+            while True:
+                report()
+                await asyncio.sleep(PROGRESS_INTERVAL)
+        
+        async def resolve(i: int):
+            nonlocal dns_done, whois_queued
+            is_dns_available = await self._dns_check_async(resolver, dns_sem, results.domains[i])
+            results.dns_available[i] = -1 if is_dns_available is None else is_dns_available
+            results.available[i] = is_dns_available is not False
+            dns_done += 1
             
-            for i, result in enumerate(dns_available):
-                if show_progress:
-                    print(f"\rWHOIS check... {i+1}/{len(dns_available)} ({(i+1)/len(dns_available)*100:.1f}%)", end='', flush=True)
-                
-                whois_result = self.whois_check(result['domain'])
-                result['whois_available'] = whois_result
+            # Unclear DNS results are left for WHOIS to decide
+            if is_dns_available is not False:
+                whois_queued += 1
+                queue.put_nowait(i)
+            elif on_result is not None:
+                on_result(results, i)
+        
+        async def verify(session):
+            nonlocal whois_done
+            while (i := await queue.get()) is not None:
+                whois_result = await self._whois_async(whois_sem, results.domains[i], session)
+                results.whois_available[i] = whois_result
                 
                 if whois_result is not None:
-                    result['available'] = whois_result
-                    result['verification_method'] = 'DNS + WHOIS'
+                    results.available[i] = whois_result
+                    results.verification_method[i] = verified
                 else:
-                    result['verification_method'] = 'DNS + WHOIS (timeout)'
-                
-                time.sleep(0.5)  # Longer delay for WHOIS to be respectful
-            
+                    results.verification_method[i] = unclear
+                whois_done += 1
+                if on_result is not None:
+                    on_result(results, i)
+        
+        progress = asyncio.create_task(report_progress()) if show_progress else None
+        try:
+            async with self._rdap_session() as session:
+                async with asyncio.TaskGroup() as tg:
+                    workers = [tg.create_task(verify(session)) for _ in range(self.whois_concurrency)]
+                    await asyncio.gather(*[resolve(i) for i in indices])
+                    for _ in workers:
+                        queue.put_nowait(None)  # No more domains to verify
+        finally:
+            if progress is not None:
+                progress.cancel()
+                report()
+    
+    def batch_check_domains(
+        self,
+        domains: List[str],
+        show_progress: bool = True,
+        on_result: Optional[Callable[[BatchResults, int], None]] = None
+    ) -> BatchResults:
+        """Check availability for all domains.
+        
+        on_result(results, i) is called as each domain's result becomes final,
+        so callers can report findings while the batch is still running.
+        """
+        results = BatchResults.for_domains(domains)
+        cached = {} if self.rebuild_cache else self._load_cache(domains)
+        taken = None if self.rebuild_cache else self._open_taken_filter()
+        known_taken = VERIFICATION_METHODS.index('Known taken')
+        
+        pending = []
+        for i, domain in enumerate(domains):
+            row = cached.get(domain)
+            if row is None:
+                if taken is not None and domain in taken:
+                    # Registered in an earlier run; registrations rarely lapse, so skip the network
+                    results.verification_method[i] = known_taken
+                    if on_result is not None:
+                        on_result(results, i)
+                else:
+                    pending.append(i)
+                continue
+            dns_available, whois_available, method = row
+            results.dns_available[i] = -1 if dns_available is None else dns_available
+            results.whois_available[i] = whois_available
+            results.available[i] = whois_available if whois_available is not None else dns_available is not False
+            results.verification_method[i] = VERIFICATION_METHODS.index(method)
+            if on_result is not None:
+                on_result(results, i)
+        
+        if pending:
+            asyncio.run(self._batch_check_async(results, pending, show_progress, on_result))
             if show_progress:
                 print("\n")
+            self._save_cache(results, pending)
+        self._remember_taken(results)
         
         return results
     
+    def _open_cache(self):
+        """Connect to the on-disk cache, creating it if needed. Returns None if it is disabled or unusable."""
+        if self._cache_db is None and self.cache_path:
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                db = sqlite3.connect(self.cache_path)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "domain TEXT PRIMARY KEY, dns_available INT, whois_available INT, "
+                    "verification_method TEXT, checked_at INT)"
+                )
+                self._cache_db = db
+            except (OSError, sqlite3.Error):
+                self.cache_path = None  # Don't retry on every batch
+        return self._cache_db
+    
+    def _load_cache(self, domains: List[str]) -> dict:
+        """Fresh cached results by domain, as (dns_available, whois_available, verification_method)."""
+        db = self._open_cache()
+        if db is None or not domains:
+            return {}
+        
+        cutoff = int(time.time()) - DISK_CACHE_TTL
+        placeholders = ','.join('?' * len(domains))
+        try:
+            rows = db.execute(
+                f"SELECT domain, dns_available, whois_available, verification_method FROM results "
+                f"WHERE checked_at > ? AND domain IN ({placeholders})",
+                [cutoff, *domains]
+            ).fetchall()
+        except sqlite3.Error:
+            return {}
+        
+        return {
+            domain: (None if dns_flag is None else bool(dns_flag), None if whois is None else bool(whois), method)
+            for domain, dns_flag, whois, method in rows
+            if method in VERIFICATION_METHODS
+        }
+    
+    def _save_cache(self, results: BatchResults, indices: List[int]):
+        """Store the conclusive results among indices. Unclear results are left to be re-checked."""
+        db = self._open_cache()
+        if db is None:
+            return
+        
+        now = int(time.time())
+        rows = []
+        for i in indices:
+            dns_available = results.dns_available[i]
+            whois_available = results.whois_available[i]
+            if whois_available is None and dns_available != 0:
+                continue  # Neither DNS nor WHOIS gave a definite answer
+            rows.append((
+                results.domains[i],
+                None if dns_available == -1 else dns_available,
+                whois_available,
+                results.method(i),
+                now
+            ))
+        
+        try:
+            with db:
+                db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error:
+            pass  # Caching is best effort
+    
+    def _open_taken_filter(self) -> Optional[TakenFilter]:
+        """Map the known-taken filter, creating it if needed. Returns None if it is disabled or unusable."""
+        if self._taken is None and self.bloom_path:
+            try:
+                # --rebuild also forgets every domain remembered as taken
+                self._taken = TakenFilter(self.bloom_path, reset=self.rebuild_cache)
+            except (OSError, ValueError):
+                self.bloom_path = None  # Don't retry on every batch
+        return self._taken
+    
+    def _remember_taken(self, results: BatchResults):
+        """Add every domain that WHOIS or RDAP confirmed as registered to the known-taken filter.
+        
+        DNS alone is not enough: a captive portal or a resolver that answers for
+        nonexistent names would otherwise mark every candidate as taken for good.
+        """
+        taken = self._open_taken_filter()
+        if taken is None:
+            return
+        
+        for i, domain in enumerate(results.domains):
+            if results.whois_available[i] is False:
+                taken.add(domain)
+        try:
+            taken.flush()
+        except OSError:
+            pass  # The filter is best effort, like the result cache
+    
+    def _openrouter_session(self, api_key: str) -> 'requests.Session':
+        """Keep-alive HTTP session for OpenRouter, created on first use so repeat calls skip the TLS handshake."""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            # Completions are billed and not idempotent: only resend when the request
+            # never reached the server or was refused before processing
+            retries = Retry(
+                total=2,
+                connect=2,
+                read=0,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=(429, 503),
+                allowed_methods=frozenset({'POST'}),
+                respect_retry_after_header=True,
+                raise_on_status=False  # Hand the final response to the status handling below
+            )
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries))
+            session.headers["Content-Type"] = "application/json"
+            self._http = session
+        self._http.headers["Authorization"] = f"Bearer {api_key}"
+        return self._http
+    
     def generate_ai_domains(self, context: str, num_domains: int = 20) -> List[str]:
         """Generate domain names using AI via OpenRouter"""
         
         openrouter_key = os.getenv('OPENROUTER_API_KEY')
+        if not openrouter_key:
+            load_env_file()  # Only read .env when the environment doesn't already have the key
+            openrouter_key = os.getenv('OPENROUTER_API_KEY')
         if not openrouter_key:
             print("⚠️  OPENROUTER_API_KEY environment variable not set")
             print("💡 Setup instructions:")
@@ -242,6 +801,8 @@ class DomainGenerator:
             print("   3. Or create a .env file with: OPENROUTER_API_KEY=your-api-key-here")
             return []
         
+        import requests  # Deferred so runs without AI generation don't pay for it
+        
         prompt = f"""Generate {num_domains} creative domain name ideas for: {context}
 
 Requirements:
@@ -261,12 +822,8 @@ insightforge
 analyticswave"""
         
         try:
-            response = requests.post(
+            response = self._openrouter_session(openrouter_key).post(
                 "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {openrouter_key}",
-                    "Content-Type": "application/json"
-                },
                 json={
                     "model": "google/gemini-2.5-flash-preview",  # Confirmed working in test
                     "messages": [
@@ -282,15 +839,13 @@ analyticswave"""
                 result = response.json()
                 content = result['choices'][0]['message']['content']
                 
-                # Parse domain names from response
-                domains = []
-                for line in content.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('#') and not line.startswith('Example'):
-                        # Clean up the line
-                        domain = re.sub(r'[^a-zA-Z0-9]', '', line.lower())
-                        if domain and len(domain) > 2:
-                            domains.append(domain)
+                # Parse domain names from response, skipping headings and the echoed example
+                lines = [line.strip() for line in content.split('\n')]
+                domains = [
+                    domain for line in lines
+                    if line and not line.startswith(self._skip_prefixes)
+                    if len(domain := self._clean_re.sub('', line.lower())) > 2
+                ]
                 
                 return domains[:num_domains]
             elif response.status_code == 402:
@@ -321,9 +876,69 @@ analyticswave"""
             print(f"⚠️  AI generation error: {e}")
             return []
 
-def run_generation_cycle():
+def prompt_int(prompt: str, default: int, low: int, high: int) -> int:
+    """Ask for an integer, clamped to [low, high]. Falls back to default on empty or invalid input."""
+    answer = input(prompt).strip()
+    digits = answer[1:] if answer.startswith(('-', '+')) else answer
+    if not digits.isdecimal():
+        return default
+    return max(low, min(high, int(answer)))
+
+def _random_open(rng: random.Random) -> float:
+    """Uniform random float in the open interval (0, 1)."""
+    r = rng.random()
+    while r == 0.0:
+        r = rng.random()
+    return r
+
+def reservoir_sample(items: Iterable[str], k: int, rng: Optional[random.Random] = None) -> List[str]:
+    """Pick up to k distinct items at random from a stream in O(k) memory.
+    
+    Uses Algorithm L, which jumps over runs of items that would not enter the
+    reservoir instead of drawing a random number per item. Repeats of an item
+    already in the reservoir are skipped, but an evicted item can come back in
+    when it reappears. The draw is uniform over the stream's positions, not its
+    distinct items: an item that occurs m times is about m times as likely to be
+    picked, so de-duplicate the stream first if that matters.
+    rng defaults to a fresh random.Random().
+    """
+    if k <= 0:
+        return []
+    if rng is None:
+        rng = random.Random()
+    
+    stream = iter(items)
+    reservoir = []
+    members = set()
+    for item in stream:
+        if item not in members:
+            reservoir.append(item)
+            members.add(item)
+            if len(reservoir) == k:
+                break
+    else:
+        rng.shuffle(reservoir)
+        return reservoir  # Stream had k distinct items or fewer
+    
+    w = math.exp(math.log(_random_open(rng)) / k)
+    while True:
+        skip = math.floor(math.log(_random_open(rng)) / math.log(1 - w))
+        item = next(itertools.islice(stream, skip, None), None)
+        if item is None:
+            break
+        if item not in members:
+            j = rng.randrange(k)
+            members.discard(reservoir[j])
+            reservoir[j] = item
+            members.add(item)
+        w *= math.exp(math.log(_random_open(rng)) / k)
+    
+    rng.shuffle(reservoir)
+    return reservoir
+
+def run_generation_cycle(rebuild_cache: bool = False, dns_concurrency: int = 64):
     """Run a single cycle of domain generation"""
-    generator = DomainGenerator()
+    generator = DomainGenerator(dns_concurrency=dns_concurrency, rebuild_cache=rebuild_cache)
     
     print("\n🌐 Advanced Domain Name Generator")
     print("=" * 45)
@@ -397,41 +1012,29 @@ def run_generation_cycle():
     # Get other preferences
     print("\n📋 Generation settings:")
     
-    try:
-        max_words = int(input("Maximum number of words per domain (2-3): ") or "2")
-        max_words = max(2, min(3, max_words))
-    except ValueError:
-        max_words = 2
+    max_words = prompt_int("Maximum number of words per domain (2-3): ", 2, 2, 3)
     
     include_numbers = input("Include numbers in domain names? (y/n): ").lower().startswith('y')
     
-    try:
-        max_domains = int(input("Maximum domains to generate (default 50): ") or "50")
-        max_domains = max(10, min(500, max_domains))
-    except ValueError:
-        max_domains = 50
+    max_domains = prompt_int("Maximum domains to generate (default 50): ", 50, 10, 500)
     
     print(f"\n🔧 Generating up to {max_domains} domains with {max_words} words...")
     
-    # Generate domains
-    manual_domains = []
-    if generator.custom_words or generator.partial_words:
-        manual_domains = generator.generate_combinations(max_words, include_numbers)
+    # Generate domains lazily and sample from the combined AI + manual stream
+    selected_domains = generator.sample_combinations(max_domains, max_words, include_numbers, extra=ai_domains)
     
-    # Combine AI and manual domains
-    all_domains = list(set(ai_domains + manual_domains))
-    
-    if not all_domains:
+    if not selected_domains:
         print("\n⚠️  No domains generated. Please check your configuration.")
         return
     
-    selected_domains = random.sample(all_domains, min(max_domains, len(all_domains)))
+    ai_set: Set[str] = set(ai_domains)  # Hashed once for the per-domain source checks below
+    ai_selected = sum(d in ai_set for d in selected_domains)
     
     print(f"✅ Generated {len(selected_domains)} unique domain combinations")
     if ai_domains:
-        print(f"  🤖 AI-generated: {len([d for d in selected_domains if d in ai_domains])}")
-    if manual_domains:
-        print(f"  🔧 Manual combinations: {len([d for d in selected_domains if d in manual_domains])}")
+        print(f"  🤖 AI-generated: {ai_selected}")
+    if generator.custom_words or generator.partial_words:
+        print(f"  🔧 Manual combinations: {len(selected_domains) - ai_selected}")
     
     # Show some examples
     print(f"\n📝 Sample domains:")
@@ -443,37 +1046,53 @@ def run_generation_cycle():
     
     if check_availability:
         print("\n🔍 Checking domain availability...")
-        results = generator.batch_check_domains(selected_domains)
         
-        # Filter available domains
-        available_domains = [r for r in results if r['available']]
-        taken_domains = [r for r in results if not r['available']]
+        # Partition results as they arrive, keeping only what gets displayed
+        available_domains = []  # (full domain, GoDaddy URL, method, icons), first 20
+        taken_domains = []      # (full domain, GoDaddy URL), first 10
+        available_count = taken_count = 0
+        
+        def on_result(results, i):
+            nonlocal available_count, taken_count
+            if results.available[i]:
+                available_count += 1
+                if len(available_domains) < 20:
+                    verification_icon = "🔍" if results.is_verified(i) else "📡"
+                    source_icon = "🤖" if results.domains[i] in ai_set else "🔧"
+                    icons = f"{verification_icon}{source_icon}"
+                    available_domains.append((results.full_domain(i), results.godaddy_url(i), results.method(i), icons))
+                    # Clear the progress line, announce the find; progress redraws below it
+                    print(f"\r\033[K  ✅ Found: {results.full_domain(i)} {icons}")
+            else:
+                taken_count += 1
+                if len(taken_domains) < 10:
+                    taken_domains.append((results.full_domain(i), results.godaddy_url(i)))
+        
+        results = generator.batch_check_domains(selected_domains, on_result=on_result)
         
         print(f"\n📊 Results Summary:")
         print(f"  • Total checked: {len(results)}")
-        print(f"  • Available: {len(available_domains)}")
-        print(f"  • Taken: {len(taken_domains)}")
+        print(f"  • Available: {available_count}")
+        print(f"  • Taken: {taken_count}")
         
         if available_domains:
-            print(f"\n🎉 Available domains ({len(available_domains)}):")
-            for result in available_domains[:20]:  # Show first 20
-                verification_icon = "🔍" if result['verification_method'] == 'DNS + WHOIS' else "📡"
-                source_icon = "🤖" if result['domain'] in ai_domains else "🔧"
-                print(f"  ✅ {result['full_domain']} {verification_icon}{source_icon}")
-                print(f"     🔗 GoDaddy: {result['godaddy_url']}")
-                print(f"     📋 Verified with: {result['verification_method']}")
+            print(f"\n🎉 Available domains ({available_count}):")
+            for full_domain, godaddy_url, method, icons in available_domains:  # First 20
+                print(f"  ✅ {full_domain} {icons}")
+                print(f"     🔗 GoDaddy: {godaddy_url}")
+                print(f"     📋 Verified with: {method}")
             
-            if len(available_domains) > 20:
-                print(f"  ... and {len(available_domains) - 20} more")
+            if available_count > 20:
+                print(f"  ... and {available_count - 20} more")
         
         # Ask if user wants to see taken domains
         if taken_domains:
             show_taken = input(f"\n👀 Show taken domains? (y/n): ").lower().startswith('y')
             if show_taken:
                 print(f"\n❌ Taken domains (first 10):")
-                for result in taken_domains[:10]:
-                    print(f"  ❌ {result['full_domain']}")
-                    print(f"     🔗 GoDaddy: {result['godaddy_url']}")
+                for full_domain, godaddy_url in taken_domains:
+                    print(f"  ❌ {full_domain}")
+                    print(f"     🔗 GoDaddy: {godaddy_url}")
     
     else:
         print(f"\n📋 Generated domains (first 20):")
@@ -485,7 +1104,7 @@ def run_generation_cycle():
     
     print(f"\n✨ Domain generation complete!")
     print("\n🔍 Icons guide:")
-    print("  🔍 = WHOIS verified")
+    print("  🔍 = WHOIS/RDAP verified")
     print("  📡 = DNS only")
     print("  🤖 = AI generated")
     print("  🔧 = Manual combination")
@@ -494,10 +1113,29 @@ def run_generation_cycle():
         print("\n💡 Tip: Set OPENROUTER_API_KEY environment variable for AI domain generation")
         print("   Get your key at: https://openrouter.ai/keys")
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate domain names and check their availability.")
+    parser.add_argument(
+        '--rebuild', action='store_true',
+        help="ignore cached availability results and re-check every domain"
+    )
+    parser.add_argument(
+        '--dns-concurrency', type=positive_int, default=64, metavar='N',
+        help="maximum number of DNS lookups in flight at once (default: 64)"
+    )
+    return parser.parse_args(argv)
+
 def main():
     """Main function with restart loop"""
+    args = parse_args()
     while True:
-        run_generation_cycle()
+        run_generation_cycle(rebuild_cache=args.rebuild, dns_concurrency=args.dns_concurrency)
         
         # Ask if user wants to start over
         print("\n" + "=" * 45)